@@ -1,9 +1,15 @@
 """3-stage LLM Council orchestration."""
 
+import re
+from collections import defaultdict
 from typing import List, Dict, Any, Tuple
 from .openrouter import query_models_parallel, query_model
 from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
 
+# Patterns used to parse rankings, compiled once at import
+NUMBERED_RANKING_PATTERN = re.compile(r'\d+\.\s*(Response [A-Z])')
+RESPONSE_LABEL_PATTERN = re.compile(r'Response [A-Z]')
+
 
 async def stage1_collect_responses(user_query: str) -> List[Dict[str, Any]]:
     """
@@ -184,27 +190,24 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
     Returns:
         List of response labels in ranked order
     """
-    import re
-
-    # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
-        # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
-            if numbered_matches:
-                # Extract just the "Response X" part
-                return [re.search(r'Response [A-Z]', m).group() for m in numbered_matches]
-
-            # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r'Response [A-Z]', ranking_section)
-            return matches
+    # Look for "FINAL RANKING:" section, splitting at most twice since only
+    # the section following the first header is used
+    parts = ranking_text.split("FINAL RANKING:", 2)
+    if len(parts) >= 2:
+        ranking_section = parts[1]
+        # Try to extract numbered list format (e.g., "1. Response A")
+        # This pattern looks for: number, period, optional space, "Response X"
+        # and captures just the "Response X" part
+        numbered_matches = NUMBERED_RANKING_PATTERN.findall(ranking_section)
+        if numbered_matches:
+            return numbered_matches
+
+        # Fallback: Extract all "Response X" patterns in order
+        matches = RESPONSE_LABEL_PATTERN.findall(ranking_section)
+        return matches
 
     # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r'Response [A-Z]', ranking_text)
+    matches = RESPONSE_LABEL_PATTERN.findall(ranking_text)
     return matches
 
 
@@ -222,20 +225,19 @@ def calculate_aggregate_rankings(
     Returns:
         List of dicts with model name and average rank, sorted best to worst
     """
-    from collections import defaultdict
-
     # Track positions for each model
     model_positions = defaultdict(list)
 
     for ranking in stage2_results:
-        ranking_text = ranking['ranking']
-
-        # Parse the ranking from the structured format
-        parsed_ranking = parse_ranking_from_text(ranking_text)
+        # Reuse the ranking already parsed in Stage 2, only parsing the raw
+        # text when it is missing
+        parsed_ranking = ranking.get('parsed_ranking')
+        if parsed_ranking is None:
+            parsed_ranking = parse_ranking_from_text(ranking['ranking'])
 
         for position, label in enumerate(parsed_ranking, start=1):
-            if label in label_to_model:
-                model_name = label_to_model[label]
+            model_name = label_to_model.get(label)
+            if model_name is not None:
                 model_positions[model_name].append(position)
 
     # Calculate average position for each model
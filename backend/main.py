@@ -2,7 +2,7 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any
 import uuid
@@ -114,13 +114,14 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
         stage3_result
     )
 
-    # Return the complete response with metadata
-    return {
+    # Return the complete response with metadata. The payload is already
+    # JSON-native, so hand it to JSONResponse to skip jsonable_encoder.
+    return JSONResponse({
         "stage1": stage1_results,
         "stage2": stage2_results,
         "stage3": stage3_result,
         "metadata": metadata
-    }
+    })
 
 
 @app.post("/api/conversations/{conversation_id}/message/stream")